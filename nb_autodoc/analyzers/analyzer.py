@@ -2,6 +2,7 @@
 
 import ast
 import os
+from importlib.util import decode_source
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -62,7 +63,7 @@ class Analyzer:
                 exec(code, _globals, _locals)
 
     def analyze(self) -> None:
-        code = open(self.path, "r").read()
+        code = decode_source(Path(self.path).read_bytes())
         self.code = code
         tree = ast_parse(code, self.path)
         visitor = DefinitionFinder(package=self.package, source=code)
@@ -6,12 +6,15 @@ from inspect import Signature
 from typing import Dict, List, NamedTuple, Optional, Union, cast
 
 from .utils import (
+    _cached_visitor,
     get_assign_names,
     get_constant_value,
     get_docstring,
+    get_source_segment,
     is_constant_node,
     resolve_name,
     signature_from_ast,
+    split_source_lines,
     unparse_attribute_or_name,
 )
 
@@ -145,6 +148,7 @@ class DefinitionFinder:
         self.package = package  # maybe null
         """Package name. Resolve relative import."""
         self.source = source
+        self.source_lines = split_source_lines(source)
         self.next_stmt: Optional[ast.stmt] = None
         self.current_classes: List[ClassDefData] = []
         self.current_function: Optional[ast.FunctionDef] = None
@@ -186,10 +190,9 @@ class DefinitionFinder:
 
     def visit(self, node: ast.AST) -> None:
         """Visit a concrete node."""
-        method = "visit_" + node.__class__.__name__
-        visitor = getattr(self, method, None)
+        visitor = _cached_visitor(self.__class__, node.__class__)
         if visitor:  # disallow generic visit
-            visitor(node)
+            visitor(self, node)
 
     def visit_body(self, body: List[ast.stmt]) -> None:
         """Traversal visit node and record peek next node."""
@@ -270,7 +273,7 @@ class DefinitionFinder:
             if docstring is not None and assign_data.docstring is None:
                 assign_data.docstring = docstring
             if node.value:
-                assign_data.value = ast.get_source_segment(self.source, node.value)
+                assign_data.value = get_source_segment(self.source_lines, node.value)
 
     def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
         return self.visit_Assign(node)  # type: ignore
@@ -1,6 +1,7 @@
 import ast
 import importlib
 import itertools
+import re
 import sys
 import typing as t
 from contextlib import contextmanager
@@ -169,7 +170,7 @@ def eval_import_stmt(
     if isinstance(stmt, ast.Import):
         for alias in stmt.names:
             try:
-                imports[alias.asname or alias.name.split(".")[0]] = __import__(
+                imports[alias.asname or alias.name.partition(".")[0]] = __import__(
                     alias.name
                 )
             except ImportError:
@@ -209,6 +210,37 @@ def get_docstring(
     return None
 
 
+_source_line_re = re.compile(r"[^\r\n]*(?:\r\n|\r|\n)|[^\r\n]+")
+
+
+def split_source_lines(source: str) -> t.List[str]:
+    """Split source into lines with line ends like `ast.get_source_segment`.
+
+    Form feed and other unicode linebreaks are not treated as line ends.
+    """
+    return _source_line_re.findall(source)
+
+
+def get_source_segment(lines: t.List[str], node: ast.AST) -> t.Optional[str]:
+    """Same as `ast.get_source_segment` on prebuilt `split_source_lines` result.
+
+    Avoid splitting the whole source for each node.
+    """
+    end_lineno = getattr(node, "end_lineno", None)
+    end_col_offset = getattr(node, "end_col_offset", None)
+    if end_lineno is None or end_col_offset is None:
+        return None
+    lineno = node.lineno - 1  # type: ignore[attr-defined]
+    end_lineno -= 1
+    col_offset = node.col_offset  # type: ignore[attr-defined]
+    # col offset is utf-8 byte offset
+    if lineno == end_lineno:
+        return lines[lineno].encode()[col_offset:end_col_offset].decode()
+    first = lines[lineno].encode()[col_offset:].decode()
+    last = lines[end_lineno].encode()[:end_col_offset].decode()
+    return "".join([first, *lines[lineno + 1 : end_lineno], last])
+
+
 _TS = t.TypeVar("_TS", bound=Signature)
 
 
@@ -303,6 +335,23 @@ def unparse_attribute_or_name(node: ast.expr) -> t.Optional[str]:
         return None
 
 
+_visitor_cache: t.Dict[t.Tuple[type, type], t.Optional[t.Callable[..., t.Any]]] = {}
+
+
+def _cached_visitor(cls: type, nodecls: type) -> t.Optional[t.Callable[..., t.Any]]:
+    """Return unbound method `visit_<nodecls name>` of visitor cls or None.
+
+    Lookup is cached per (visitor class, node class) pair.
+    """
+    try:
+        return _visitor_cache[cls, nodecls]
+    except KeyError:
+        visitor = _visitor_cache[cls, nodecls] = getattr(
+            cls, "visit_" + nodecls.__name__, None
+        )
+        return visitor
+
+
 class Unparser(ast.NodeVisitor):
     """Utilities like `ast._Unparser` in py3.9+.
 
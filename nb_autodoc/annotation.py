@@ -13,10 +13,15 @@ And function annotation depends on its definition (needs inferer).
 from __future__ import annotations
 
 import ast
+import re
+import sys
 import typing as t
 from contextlib import contextmanager
+from functools import lru_cache
+from keyword import iskeyword
 
 from nb_autodoc.analyzers.utils import (
+    _cached_visitor,
     get_constant_value,
     get_subst_args,
     is_constant_node,
@@ -64,11 +69,15 @@ def _type_str(ann: _T_annexpr) -> str:
 
 
 class _annexpr:
+    __slots__ = ()
+
     def __str__(self) -> str:
         return AnnExprVisitor().render(self)
 
 
 class Name(_annexpr):
+    __slots__ = ("name",)
+
     def __init__(self, name: str) -> None:
         self.name = name
 
@@ -78,24 +87,44 @@ class Name(_annexpr):
     # in typing.__dict__.values() is typing object
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Name):
             return False
         return self.name == other.name
 
 
+@lru_cache(maxsize=4096)
+def _intern_name(name: str) -> Name:
+    # shared `Name` instances, names repeat in almost every signature
+    return Name(sys.intern(name))
+
+
 class TypingName(_annexpr):
+    __slots__ = ("name", "tp_name")
+
     def __init__(self, name: str, tp_name: str) -> None:
         self.name = name
         self.tp_name = tp_name
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, TypingName):
             return False
         return self.name == other.name and self.tp_name == other.tp_name
 
 
+@lru_cache(maxsize=4096)
+def _intern_typing_name(name: str, tp_name: str) -> TypingName:
+    # shared `TypingName` instances, same as `Name`
+    return TypingName(sys.intern(name), sys.intern(tp_name))
+
+
 class UnionType(_annexpr):
     # typing.Union and py3.10 `X | Y`
+    __slots__ = ("args",)
+
     def __init__(self, args: list[_annexpr | None]) -> None:
         new_args = []
         for arg in args:
@@ -119,6 +148,8 @@ _literal_tp = t.Union[int, bool, str, bytes, None]
 
 
 class Literal(_annexpr):
+    __slots__ = ("args",)
+
     def __init__(self, args: list[_literal_tp | Name]) -> None:
         # int, bool, str, bytes, None or enum
         # literal should not be dups and nested
@@ -131,6 +162,8 @@ class Literal(_annexpr):
 
 
 class Annotated(_annexpr):
+    __slots__ = ("origin",)
+
     def __init__(self, origin: _annexpr) -> None:
         self.origin = origin
 
@@ -142,6 +175,8 @@ class Annotated(_annexpr):
 
 class GASubscript(_annexpr):
     # origin is class. repr class.__name__
+    __slots__ = ("origin", "args")
+
     def __init__(
         self, origin: Name | TypingName, args: list[_annexpr | ellipsis | None]
     ) -> None:
@@ -156,6 +191,8 @@ class GASubscript(_annexpr):
 
 
 class CallableType(_annexpr):
+    __slots__ = ("args", "ret")
+
     def __init__(
         self, args: list[_annexpr] | ellipsis | GASubscript | Name, ret: _annexpr | None
     ) -> None:
@@ -172,16 +209,44 @@ class CallableType(_annexpr):
         return self.args == other.args and self.ret == other.ret
 
 
+_dotted_name_re = re.compile(r"[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*", re.ASCII)
+
+
+def parse_string_annotation(value: str) -> ast.expr:
+    """Parse string annotation into expression node.
+
+    The node may be shared between callers, so it must not be mutated.
+    """
+    return _parse_string_annotation(value)
+
+
+@lru_cache(maxsize=2048)
+def _parse_string_annotation(value: str) -> ast.expr:
+    # string annotation (like ForwardRef) tends to repeat across signatures
+    # the transformer never mutates the node, so it is safe to share
+    if _dotted_name_re.fullmatch(value):
+        # most annotations are plain dotted names, build them without parser
+        name, *attrs = value.split(".")
+        if not iskeyword(name) and not any(map(iskeyword, attrs)):
+            node: ast.expr = ast.Name(id=name, ctx=ast.Load())
+            for attr in attrs:
+                node = ast.Attribute(value=node, attr=attr, ctx=ast.Load())
+            return node
+    return ast.parse(value, mode="eval").body
+
+
 class AnnotationTransformer(ast.NodeVisitor):  # type hint
     def __init__(self, norm_typing_name: t.Callable[[str], str | None]) -> None:
         self.norm_typing_name = norm_typing_name
 
     def visit(self, node: ast.expr) -> t.Any:  # type: ignore[override]
-        method = "visit_" + node.__class__.__name__
-        visitor = getattr(self, method, None)
+        nodecls = node.__class__
+        visitor = _cached_visitor(self.__class__, nodecls)
         if visitor:  # disallow generic visit
-            return visitor(node)
-        raise TypeError(f"try to visit invalid annotation node {method}")
+            return visitor(self, node)
+        raise TypeError(
+            f"try to visit invalid annotation node visit_{nodecls.__name__}"
+        )
 
     def visit_BinOp(self, node: ast.BinOp) -> UnionType:
         if not isinstance(node.op, ast.BitOr):
@@ -197,7 +262,7 @@ class AnnotationTransformer(ast.NodeVisitor):  # type hint
             if isinstance(value, str):
                 # Literal or Annotated may contains quotes
                 # so we can't replace quotes to parse ForwardRef
-                return self.visit(ast.parse(value, mode="eval").body)
+                return self.visit(_parse_string_annotation(value))
             elif value in (None, ...):
                 return value
             raise TypeError(f"unsupported Constant node type {type(value)}")
@@ -209,8 +274,8 @@ class AnnotationTransformer(ast.NodeVisitor):  # type hint
             raise TypeError("Attribute is not dotted name")
         typing_name = self.norm_typing_name(name)
         if typing_name:
-            return TypingName(name, typing_name)
-        return Name(name)
+            return _intern_typing_name(name, typing_name)
+        return _intern_name(name)
 
     def visit_Name(self, node: ast.Name) -> Name:
         return self.visit_Attribute(node)  # type: ignore
@@ -332,12 +397,12 @@ class AnnExprVisitor:
         return "".join(self._builder)
 
     def visit(self, annexpr: _annexpr) -> None:
-        method = "visit_" + annexpr.__class__.__name__
-        visitor = getattr(self, method, None)
+        annexprcls = annexpr.__class__
+        visitor = _cached_visitor(self.__class__, annexprcls)
         if visitor:
-            return visitor(annexpr)
+            return visitor(self, annexpr)
         # disallow generic visit
-        raise TypeError(f"try to visit invalid annexpr {method}")
+        raise TypeError(f"try to visit invalid annexpr visit_{annexprcls.__name__}")
 
     def visit_Name(self, annexpr: Name) -> None:
         name = annexpr.name
@@ -390,11 +455,16 @@ class AnnExprVisitor:
 
 
 def _get_typing_normalizer(context: _AnnContext) -> t.Callable[[str], str | None]:
+    typing_names = context.typing_names
+    # any attribute of typing module is typing name, so it can't be flattened
+    typing_module = frozenset(context.typing_module)
+
     def _norm_typing_name(name: str) -> str | None:
-        if name in context.typing_names:
-            return context.typing_names[name]
+        tp_name = typing_names.get(name)
+        if tp_name is not None:
+            return tp_name
         module, dot, attr = name.partition(".")
-        if dot and module in context.typing_module:
+        if dot and module in typing_module:
             return attr
 
     return _norm_typing_name
@@ -415,8 +485,7 @@ class Annotation:
         globalns: dict[str, T_Definition] | None = None,
         manager: ModuleManager | None = None,
     ) -> None:
-        norm = _get_typing_normalizer(context)
-        self.ann: _T_annexpr = AnnotationTransformer(norm).visit(ast_expr)
+        self.ann: _T_annexpr = AnnotationTransformer(context.normalizer).visit(ast_expr)
         if globalns is None:
             globalns = {}
         self.globalns = globalns
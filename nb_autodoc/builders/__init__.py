@@ -2,7 +2,6 @@
 
 import abc
 import shutil
-from fnmatch import fnmatchcase
 from pathlib import Path
 from typing import Callable, Iterable, List, Optional, Tuple
 from typing_extensions import final
@@ -10,6 +9,7 @@ from typing_extensions import final
 from nb_autodoc.log import logger
 from nb_autodoc.manager import Class, ImportRef, Module, ModuleManager, Variable
 from nb_autodoc.typing import T_ClassMember, T_Definition, T_ModuleMember
+from nb_autodoc.utils import fnmatch_filter
 
 default_slugify = lambda dobj: None
 
@@ -92,10 +92,9 @@ class Builder(abc.ABC):
         self.output_dir = Path(manager.config["output_dir"])
         self.write_encoding = manager.config["write_encoding"]
         # get documentable modules and paths
-        skip_doc_modules = list(manager.config["exclude_documentation_modules"])
         path_factory = manager.config["path_factory"]
         member_iterator_cls = manager.config["member_iterator_cls"]
-        exclude_module = lambda x: any(fnmatchcase(x, pt) for pt in skip_doc_modules)
+        exclude_module = fnmatch_filter(manager.config["exclude_documentation_modules"])
         if path_factory is None:
             path_factory = default_path_factory
         self.modules: dict[str, Module] = {}
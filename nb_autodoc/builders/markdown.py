@@ -1,4 +1,3 @@
-import ast
 import inspect
 import re
 from contextlib import contextmanager
@@ -10,6 +9,7 @@ from typing import Callable, Dict, Generator, List, Match, Optional, Union
 from typing_extensions import Literal
 
 from nb_autodoc import nodes
+from nb_autodoc.annotation import parse_string_annotation
 from nb_autodoc.builders import Builder, MemberIterator
 from nb_autodoc.config import Config
 from nb_autodoc.log import logger
@@ -336,7 +336,7 @@ class Renderer:
                 # doc overridden annotation or parameter annotation
                 if doc_arg and doc_arg.annotation:
                     annotation = bind_module.build_static_ann(
-                        ast.parse(doc_arg.annotation, mode="eval").body
+                        parse_string_annotation(doc_arg.annotation)
                     ).get_doc_linkify(self.add_link, escape_md_chars)
                 elif p.annotation is not Parameter.empty:
                     annotation = p.annotation.get_doc_linkify(
@@ -367,7 +367,7 @@ class Renderer:
                 annotation = None
                 if doc_arg.annotation:
                     annotation = bind_module.build_static_ann(
-                        ast.parse(doc_arg.annotation, mode="eval").body
+                        parse_string_annotation(doc_arg.annotation)
                     ).get_doc_linkify(self.add_link, escape_md_chars)
                 new_args.kwonlyargs.append(
                     nodes.ColonArg(
@@ -392,7 +392,7 @@ class Renderer:
             if isinstance(rets.value, nodes.ColonArg):
                 assert rets.value.annotation, "Returns ColonArg annotation must be str"
                 annotation = bind_module.build_static_ann(
-                    ast.parse(rets.value.annotation, mode="eval").body
+                    parse_string_annotation(rets.value.annotation)
                 ).get_doc_linkify(self.add_link, escape_md_chars)
                 descr = rets.value.descr
                 long_descr = rets.value.long_descr
@@ -494,7 +494,7 @@ class Renderer:
         elif dobj.doctree and dobj.doctree.annotation:
             self.write(
                 dobj.module.build_static_ann(
-                    ast.parse(dobj.doctree.annotation, mode="eval").body
+                    parse_string_annotation(dobj.doctree.annotation)
                 ).get_doc_linkify(self.add_link, escape_md_chars)
             )
         else:
@@ -600,9 +600,10 @@ class Renderer:
         iskw: bool = False,
         link_ann: bool = False,
     ) -> None:
-        if link_ann and dsobj.annotation:
-            dsobj.annotation = self.current_module.build_static_ann(
-                ast.parse(dsobj.annotation, mode="eval").body
+        annotation = dsobj.annotation
+        if link_ann and annotation:
+            annotation = self.current_module.build_static_ann(
+                parse_string_annotation(annotation)
             ).get_doc_linkify(self.add_link, escape_md_chars)
         self.fill("- ")
         if dsobj.name:
@@ -612,12 +613,12 @@ class Renderer:
                 if iskw:
                     self.write("**")
                 self.write(dsobj.name)
-            if dsobj.annotation:
+            if annotation:
                 self.write(" ")
                 with self.delimit("(", ")"):
-                    self.write(dsobj.annotation)
-        elif dsobj.annotation:
-            self.write(dsobj.annotation)
+                    self.write(annotation)
+        elif annotation:
+            self.write(annotation)
         else:
             raise RuntimeError("ColonArg requires at least name or annotation field")
         if dsobj.descr:
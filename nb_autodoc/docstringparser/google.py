@@ -2,7 +2,17 @@
 """
 import re
 from functools import lru_cache, wraps
-from typing import Callable, List, Match, Optional, Type, TypeVar, cast
+from typing import (
+    Callable,
+    ClassVar,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Type,
+    TypeVar,
+    cast,
+)
 from typing_extensions import Concatenate, ParamSpec
 
 from nb_autodoc.log import logger
@@ -125,21 +135,35 @@ class GoogleStyleParser:
             raise ParserError("indent is not specified")
         return self._indent
 
+    _known_marker_re: ClassVar["Pattern[str]"]
+
+    @classmethod
+    def _get_known_marker_re(cls) -> "Pattern[str]":
+        # known section markers only, so 'Anything:' in description is skipped
+        # built per class on first use, so subclass sections are included
+        pattern = cls.__dict__.get("_known_marker_re")
+        if pattern is None:
+            pattern = re.compile(
+                r"^(?:"
+                + "|".join(
+                    re.escape(name)
+                    for name in (*cls._sections, *cls._inline_sections)
+                    if re.fullmatch(r"\w+", name)  # same as `_section_marker_re`
+                )
+                + r")(?= *(?:\([0-9\.\+\-]+\))? *:)",
+                re.M,
+            )
+            cls._known_marker_re = pattern
+        return pattern
+
     @lru_cache(1)
     def _find_first_marker(self) -> Optional[int]:
-        partition_lineno = None
-        for i in range(len(self.lines)):
-            match = self._section_marker_re.match(self.lines[i])
-            if match:
-                if (
-                    match.group(1)
-                    not in self._sections.keys() | self._inline_sections.keys()
-                ):
-                    # maybe 'Anything:' in description
-                    continue
-                partition_lineno = i
-                break
-        return partition_lineno
+        # one regex sweep over the whole docstring instead of matching line by line
+        text = "\n".join(self.lines)
+        match = self._get_known_marker_re().search(text)
+        if match is None:
+            return None
+        return text.count("\n", 0, match.start())
 
     def _consume_spaces(self) -> None:
         spaces = len(self.line) - len(self.line.lstrip())
@@ -249,8 +273,8 @@ class GoogleStyleParser:
         marker_line = self.line
         self.lineno += 1
         self._consume_linebreaks()
-        if name in self._inline_sections:
-            type_ = self._inline_sections[name]
+        type_ = self._inline_sections.get(name)
+        if type_ is not None:
             value = marker_line[match.end() :].strip()
             return InlineValue(name=name, type=type_, value=value)
         try:
@@ -4,9 +4,10 @@ from __future__ import annotations as _
 
 import ast
 import dataclasses
+import sys
 from inspect import Parameter, Signature, getsource, unwrap
 from types import FunctionType, MappingProxyType, ModuleType
-from typing import Any, Dict, NamedTuple, TypeVar, cast
+from typing import Any, Callable, Dict, TypeVar, cast
 from typing_extensions import TypeAlias
 
 from nb_autodoc.analyzers.analyzer import Analyzer
@@ -16,8 +17,16 @@ from nb_autodoc.analyzers.definitionfinder import (
     FunctionDefData,
     ImportFromData,
 )
-from nb_autodoc.analyzers.utils import signature_from_ast
-from nb_autodoc.annotation import Annotation
+from nb_autodoc.analyzers.utils import (
+    get_source_segment,
+    signature_from_ast,
+    split_source_lines,
+)
+from nb_autodoc.annotation import (
+    Annotation,
+    _get_typing_normalizer,
+    parse_string_annotation,
+)
 from nb_autodoc.config import Config, default_config
 from nb_autodoc.docstringparser import GoogleStyleParser
 from nb_autodoc.log import current_module, logger
@@ -130,6 +139,7 @@ class ModuleManager:
         }
         self.prepared = False
         self.modules: dict[str, Module] = modules
+        self._dotted_definitions: dict[str, T_Definition | None] = {}
         for m in self.modules.values():
             m.prepare()
         self.prepared = True
@@ -149,15 +159,26 @@ class ModuleManager:
             return module.get_canonical_member(qualname)
 
     def get_definition_dotted(self, refname: str) -> T_Definition | None:
+        # the same refname is resolved for every annotation that mentions it
+        try:
+            return self._dotted_definitions[refname]
+        except KeyError:
+            pass
+        dobj = None
         # longest module first
         modulename, dot, qualname = refname.rpartition(".")
         while modulename:
             if not dot:
                 break
             if modulename in self.modules:
-                return self.modules[modulename].get_canonical_member(qualname)
+                dobj = self.modules[modulename].get_canonical_member(qualname)
+                break
             modulename, dot, _ = modulename.rpartition(".")
             qualname = refname[len(modulename) + 1 :]
+        # members are incomplete until all modules are prepared
+        if self.prepared:
+            self._dotted_definitions[refname] = dobj
+        return dobj
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} {self.name!r}>"
@@ -216,6 +237,7 @@ class Module:
     ) -> None:
         self.manager = manager
         self.members: dict[str, T_ModuleMember | ImportRef] = {}
+        self._all_definitions: dict[str, T_Definition] | None = None
         self.name = name
         # if py and pyi both exist, then py (include extension) is only used to extract docstring
         # if one of them exists, then analyze that one
@@ -327,7 +349,10 @@ class Module:
                 return obj
 
     def add_member(self, name: str, obj: T_ModuleMember | ImportRef) -> None:
-        self.members[name] = self.manager.context[f"{self.name}:{name}"] = obj
+        # context keys are probed by every ImportRef resolution
+        self.members[name] = self.manager.context[
+            sys.intern(f"{self.name}:{name}")
+        ] = obj
 
     def get_canonical_member(self, qualname: str) -> T_Definition | None:
         """Find canonical member definition.
@@ -346,6 +371,9 @@ class Module:
             return dobj.get_canonical_member(attr)
 
     def get_all_definitions(self) -> Dict[str, T_Definition]:
+        # every annotation of module shares it as globalns
+        if self._all_definitions is not None:
+            return self._all_definitions
         defs: dict[str, T_Definition] = {}
         for member in self.members.values():
             if isinstance(member, ImportRef):
@@ -357,6 +385,9 @@ class Module:
                     defs[clsmember.qualname] = clsmember
             else:
                 defs[member.qualname] = member
+        # import reference is unresolvable until all modules are prepared
+        if self.manager.prepared:
+            self._all_definitions = defs
         return defs
 
     def prepare(self) -> None:
@@ -381,7 +412,11 @@ class Module:
                 elif astobj.module in self.manager.modules:
                     self.add_member(
                         name,
-                        ImportRef(name, self, f"{astobj.module}:{astobj.orig_name}"),
+                        ImportRef(
+                            name,
+                            self,
+                            sys.intern(f"{astobj.module}:{astobj.orig_name}"),
+                        ),
                     )
             elif isinstance(astobj, ClassDefData):
                 # pass if ClassDef is decorated as function or other types
@@ -411,13 +446,17 @@ class Module:
         if libdocs:
             logger.warning(f"cannot solve autodoc item {libdocs}")
 
+    @cached_property
+    def ann_context(self) -> _AnnContext:
+        return _AnnContext(
+            self.prime_analyzer.module.typing_module,
+            self.prime_analyzer.module.typing_names,
+        )
+
     def build_static_ann(self, expr: ast.expr) -> Annotation:
         return Annotation(
             expr,
-            _AnnContext(
-                self.prime_analyzer.module.typing_module,
-                self.prime_analyzer.module.typing_names,
-            ),
+            self.ann_context,
             globalns=self.get_all_definitions(),
             manager=self.manager,
         )
@@ -427,6 +466,7 @@ class Module:
     ) -> FunctionSignature:
         if not source:
             source = self.prime_analyzer.code
+        source_lines: list[str] | None = None
         _empty = Parameter.empty
         params = sig.parameters.copy()
         for param in sig.parameters.values():
@@ -435,8 +475,10 @@ class Module:
             if annotation is not _empty:
                 annotation = self.build_static_ann(annotation)
             if default is not _empty:
+                if source_lines is None:
+                    source_lines = split_source_lines(source)
                 default = _AlwaysStr(
-                    cleanexpr(cast(str, ast.get_source_segment(source, default)))
+                    cleanexpr(cast(str, get_source_segment(source_lines, default)))
                 )
             params[param.name] = param.replace(annotation=annotation, default=default)
         return_annotation = sig.return_annotation
@@ -549,7 +591,7 @@ class Class:
 
     def add_member(self, name: str, obj: T_ClassMember) -> None:
         self.members[name] = self.module.manager.context[
-            f"{self.fullname}.{name}"
+            sys.intern(f"{self.fullname}.{name}")
         ] = obj
 
     def get_canonical_member(self, name: str) -> T_ClassMember | None:
@@ -852,9 +894,7 @@ class Variable:
         if self.is_typealias:
             astobj = cast(AssignData, self.astobj)
             assert astobj.value, "TypeAlias must have assignment value"
-            return self.module.build_static_ann(
-                ast.parse(astobj.value, mode="eval").body
-            )
+            return self.module.build_static_ann(parse_string_annotation(astobj.value))
         elif isinstance(self.pyobj, property) and self.pyobj.fget:
             sig = Function._get_signature(self.pyobj.fget, self.module.manager.modules)
             if sig and sig.return_annotation is not Parameter.empty:
@@ -896,9 +936,16 @@ class EnumMember:
         return f"{self.module.name}:{self.name}"
 
 
-class _AnnContext(NamedTuple):
-    typing_module: list[str]
-    typing_names: dict[str, str]
+class _AnnContext:
+    """Typing imports of module, used to normalize typing names."""
+
+    def __init__(self, typing_module: list[str], typing_names: dict[str, str]) -> None:
+        self.typing_module = typing_module
+        self.typing_names = typing_names
+
+    @cached_property
+    def normalizer(self) -> Callable[[str], str | None]:
+        return _get_typing_normalizer(self)
 
 
 class _AlwaysStr(str):
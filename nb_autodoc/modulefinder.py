@@ -22,15 +22,17 @@ import typing as t
 from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
-from fnmatch import fnmatchcase
 from importlib import import_module
-from importlib.machinery import ExtensionFileLoader, SourceFileLoader, all_suffixes
-from importlib.util import module_from_spec, spec_from_loader
+from importlib.machinery import ExtensionFileLoader, SourceFileLoader
+from importlib.util import decode_source, module_from_spec, spec_from_loader
 from itertools import accumulate, islice
+from pathlib import Path
 
 from nb_autodoc.log import logger
 from nb_autodoc.utils import (
     _co_future_flags,
+    _module_suffixes,
+    fnmatch_filter,
     frozendict,
     getmodulename,
     transform_dict_value,
@@ -143,7 +145,7 @@ class _Finder:
     @t.final
     @staticmethod
     def _build_filter(patterns: t.Iterable[str]) -> _Filter:
-        return lambda x: any(fnmatchcase(x, pt) for pt in patterns)
+        return fnmatch_filter(patterns)
 
 
 _special_exclude_dirs = [
@@ -159,7 +161,7 @@ _special_exclude_modulename = ["__init__", "__main__"]
 def _looks_like_package(path: str) -> bool:
     for fn in os.listdir(path):
         left, dot, right = fn.partition(".")
-        if dot and left == "__init__" and "." + right in all_suffixes():
+        if dot and left == "__init__" and "." + right in _module_suffixes:
             return True
     return False
 
@@ -304,7 +306,7 @@ class ModuleFinder(_Finder):
         # assert file, f"module {module} has no file location"
         if file is not None:
             file_dir, basename = os.path.split(file)
-            stub_path = os.path.join(file_dir, basename.split(".", 1)[0] + ".pyi")
+            stub_path = os.path.join(file_dir, basename.partition(".")[0] + ".pyi")
             if os.path.isfile(stub_path):
                 # top module has stub
                 stub = create_module_from_sourcefile(
@@ -338,7 +340,7 @@ class _StubSourceFileLoader(SourceFileLoader):
     def exec_module(self, module: types.ModuleType) -> None:
         # custom implementation because we don't want to cache bytecode
         # and need to give `annotations` flag to code compilation
-        code = open(self.path).read()
+        code = decode_source(Path(self.path).read_bytes())
         # current cpython only has feature `annotations`
         # if there has more features in future, we should extract them and bitwise OR them
         flags = _co_future_flags["annotations"]
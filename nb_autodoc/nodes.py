@@ -8,10 +8,18 @@ TD = TypeVar("TD", bound="Document")
 
 
 class DocumentMeta(type):
+    def __new__(
+        mcls, name: str, bases: tuple[type, ...], namespace: dict[str, Any]
+    ) -> DocumentMeta:
+        # every annotated attribute is stored in slots, including the
+        # position info of lowercase abstract nodes
+        if "__slots__" not in namespace:
+            namespace["__slots__"] = tuple(namespace.get("__annotations__", ()))
+        return super().__new__(mcls, name, bases, namespace)
+
     def __init__(
         cls, name: str, bases: tuple[type, ...], namespace: dict[str, Any]
     ) -> None:
-        # TODO: add slots support
         super().__init__(name, bases, namespace)
         annotations = getattr(cls, "__annotations__", {})
         # create _fields implicitly
@@ -29,9 +37,12 @@ class DocumentMeta(type):
                 f"{cls.__name__} constructor takes at most "
                 f"{len(cls._fields)} positional arguments"
             )
-        obj_dict = self.__dict__ = dict.fromkeys(cls._fields)
-        obj_dict.update(zip(cls._fields, args))
-        obj_dict.update(kwargs)
+        for field in cls._fields:
+            setattr(self, field, None)
+        for field, value in zip(cls._fields, args):
+            setattr(self, field, value)
+        for field, value in kwargs.items():
+            setattr(self, field, value)
         return self
 
 
@@ -55,6 +66,7 @@ def eq_mixin(cls: Type[TD]) -> Type[TD]:
 
 
 class Document(metaclass=DocumentMeta):
+    __slots__ = ()
     _fields: ClassVar[tuple[str, ...]]
 
     # only type hint because parameters were never passed in
@@ -6,12 +6,14 @@ import sys
 import typing as t
 import typing_extensions as te
 from enum import Enum
+from fnmatch import translate as fnmatch_translate
+from functools import lru_cache
 from importlib.machinery import all_suffixes
 from inspect import Signature
 from operator import attrgetter
 from os.path import commonprefix
 from pathlib import Path
-from types import BuiltinFunctionType, FunctionType, MappingProxyType
+from types import BuiltinFunctionType, MappingProxyType
 from typing import NamedTuple
 
 _co_future_flags = {"annotations": _future.annotations.compiler_flag}
@@ -116,15 +118,31 @@ def isenumclass(cls: type) -> te.TypeGuard[t.Type[Enum]]:
     return issubclass(cls, Enum)
 
 
+_module_suffixes = frozenset(all_suffixes())
+"""Suffixes of importable module files, like `.py` and `.so`."""
+
+
 def getmodulename(path: str) -> t.Optional[str]:
     """Reimplement `inspect.getmodulename` for identifier modulename."""
     fn = os.path.basename(path)
     left, dot, right = fn.partition(".")
-    if dot and left.isidentifier() and "." + right in all_suffixes():
+    if dot and left.isidentifier() and "." + right in _module_suffixes:
         return left
     return None
 
 
+def fnmatch_filter(patterns: t.Iterable[str]) -> t.Callable[[str], bool]:
+    """Return a case-sensitive checker if name matches any of `fnmatch` patterns.
+
+    Patterns are merged into a single regex instead of trying them one by one.
+    """
+    patterns = list(patterns)
+    if not patterns:
+        return lambda name: False
+    match = re.compile("|".join(map(fnmatch_translate, patterns))).match
+    return lambda name: match(name) is not None
+
+
 def find_name_in_mro(cls: type, name: str, default: t.Any) -> t.Any:
     for base in cls.__mro__:
         if name in vars(base):
@@ -132,23 +150,6 @@ def find_name_in_mro(cls: type, name: str, default: t.Any) -> t.Any:
     return default
 
 
-def determind_varname(obj: t.Union[type, FunctionType]) -> str:
-    # Maybe implement in AST analysis
-    module = sys.modules[obj.__module__]
-    for name, value in module.__dict__.items():
-        if obj is value:
-            return name
-    raise RuntimeError(
-        "could not determine where the object located. "
-        f"object: {obj!r} __module__: {obj.__module__} __qualname__: {obj.__qualname__}"
-    )
-
-
-# TODO: extract function arguments without body
-def findparamsource(obj: FunctionType) -> str:  # type: ignore  # mypy
-    ...
-
-
 def stringify_signature(
     sig: Signature, *, show_annotation: bool = False, show_returns: bool = False
 ) -> str:
@@ -185,12 +186,14 @@ def dedent(s: str) -> str:
     * Pretty better preformance (powered by pytest-benchmark).
     """
     lines = s.split("\n")  # splitlines will ignore the last newline
-    margin = float("inf")
+    margin = None
     for line in lines:
         if line:
-            margin = min(margin, len(line) - len(line.lstrip()))
-    # margin is only inf in case string empty
-    if isinstance(margin, float):
+            indent = len(line) - len(line.lstrip())
+            if margin is None or indent < margin:
+                margin = indent
+    # margin is only None in case string empty, nothing to do if zero
+    if not margin:
         return s
     for i in range(len(lines)):
         lines[i] = lines[i][margin:]
@@ -203,19 +206,24 @@ def cleandoc(s: str, strict: bool = False) -> str:
     * Fix `inspect.cleandoc` do not remove space only lines (strict mode).
     * Slightly better performance (powered by pytest-benchmark).
     """
-    lines = s.rstrip().expandtabs().splitlines()
+    return _cleandoc(s, strict)
+
+
+@lru_cache(maxsize=4096)
+def _cleandoc(s: str, strict: bool) -> str:
+    s = s.rstrip()
+    if "\t" in s:
+        s = s.expandtabs()
+    lines = s.splitlines()
     if strict:
         if any(line.isspace() for line in lines):
             raise ValueError
-    margin = len(lines[-1]) - len(lines[-1].lstrip())
-    for line in lines[1:-1]:
-        if line:
-            margin = min(margin, len(line) - len(line.lstrip()))
-    for i in range(1, len(lines)):
-        lines[i] = lines[i][margin:]
-    while lines and not lines[0]:
-        lines.pop(0)
-    return "\n".join(lines)
+    # the last line is never empty after rstrip, so margin is always found
+    margin = min([len(line) - len(line.lstrip()) for line in lines[1:] if line] or [0])
+    if margin:
+        lines[1:] = [line[margin:] for line in lines[1:]]
+    # leading blank lines are joined as bare linebreaks
+    return "\n".join(lines).lstrip("\n")
 
 
 def interleave(
@@ -274,10 +282,13 @@ class cached_property(t.Generic[T]):
             raise TypeError(
                 f"cannot assign the cached_property named {self.attrname!r} to {name!r}"
             )
+        # interned key makes instance dict lookup an identity compare
+        self.attrname = sys.intern(name)
 
     def __get__(self, instance: t.Optional[t.Any], owner: t.Type[t.Any]) -> T:
         if instance is None:
             return self  # type: ignore
+        name = self.attrname
         try:
             cache = instance.__dict__
         except (
@@ -285,13 +296,11 @@ class cached_property(t.Generic[T]):
         ):  # not all objects have __dict__ (e.g. class defines slots)
             msg = (
                 f"No '__dict__' attribute on {type(instance).__name__!r} "
-                f"instance to cache {self.attrname!r} property."
+                f"instance to cache {name!r} property."
             )
             raise TypeError(msg) from None
-        try:
-            return cache[self.attrname]
-        except KeyError:
-            pass  # avoid extra traceback
-        val = self.func(instance)
-        cache[self.attrname] = val
+        val = cache.get(name, _NULL)
+        if val is _NULL:
+            val = self.func(instance)
+            cache[name] = val
         return val
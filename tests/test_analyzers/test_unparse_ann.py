@@ -1,18 +1,26 @@
+import pytest
+
 from nb_autodoc.analyzers.unparse_ann import convert_annot
 
 
-def test_convert_annot():
-    assert (
-        convert_annot("Union[List[int], Tuple[int], Set[int], Dict[str, int]]")
-        == "list[int] | tuple[int] | set[int] | dict[str, int]"
-    )
-    assert convert_annot("Optional[str]") == "str | None"
-    assert convert_annot("Callable[..., str]") == "(*Any, **Any) -> str"
-    assert (
-        convert_annot("Callable[[int, str], Callable[[str], Callable[[], None]]]")
-        == "(int, str) -> (str) -> () -> None"
-    )
-    assert (
-        convert_annot("Union[Callable[[], Optional[str]], str, None]")
-        == "() -> (str | None) | str | None"
-    )
+@pytest.mark.parametrize(
+    "annot, expected",
+    [
+        (
+            "Union[List[int], Tuple[int], Set[int], Dict[str, int]]",
+            "list[int] | tuple[int] | set[int] | dict[str, int]",
+        ),
+        ("Optional[str]", "str | None"),
+        ("Callable[..., str]", "(*Any, **Any) -> str"),
+        (
+            "Callable[[int, str], Callable[[str], Callable[[], None]]]",
+            "(int, str) -> (str) -> () -> None",
+        ),
+        (
+            "Union[Callable[[], Optional[str]], str, None]",
+            "() -> (str | None) | str | None",
+        ),
+    ],
+)
+def test_convert_annot(annot: str, expected: str):
+    assert convert_annot(annot) == expected
@@ -1,4 +1,7 @@
 import ast
+from functools import lru_cache
+
+import pytest
 
 from nb_autodoc.annotation import (
     Annotated,
@@ -12,10 +15,12 @@ from nb_autodoc.annotation import (
     UnionType,
     _annexpr,
     _get_typing_normalizer,
+    parse_string_annotation,
 )
 from nb_autodoc.manager import _AnnContext
 
 
+@lru_cache(maxsize=None)
 def get_expr(s: str) -> ast.expr:
     return ast.parse(s, mode="eval").body
 
@@ -156,3 +161,10 @@ class TestAnnotation:
         anncontext = _AnnContext(["t"], {})
         ann = Annotation(get_expr("t.ClassVar[int]"), anncontext)
         assert ann.is_classvar
+
+
+def test_parse_string_annotation():
+    for s in ("int", "t.Optional", "a.b.c", "None", "True", "List[int]"):
+        assert ast.dump(parse_string_annotation(s)) == ast.dump(get_expr(s))
+    with pytest.raises(SyntaxError):
+        parse_string_annotation("a.None")
@@ -4,6 +4,8 @@ from nb_autodoc.manager import Function, ModuleManager
 
 from .utils import uncache_import
 
+_SINGLE_MEMBERS = frozenset({"foo", "func"})
+
 
 @pytest.fixture(scope="module", name="simple_manager")
 def _():
@@ -11,6 +13,11 @@ def _():
         return ModuleManager("simple_pkg")
 
 
+@pytest.fixture(scope="module", name="canonical_manager")
+def _():
+    return ModuleManager("tests.managerdata.get_canonical_member")
+
+
 # def test__refine_autodoc_from_ast(simple_manager: ModuleManager):
 #     module = simple_manager.modules["simple_pkg"]
 #     reexport = simple_manager.modules["simple_pkg.reexport"]
@@ -72,17 +79,17 @@ class TestModuleManager:
         assert manager.name == "tests.managerdata.single"
         assert len(manager.modules) == 1
         single = manager.modules["tests.managerdata.single"]
-        assert single.members.keys() == {"foo", "func"}
+        assert single.members.keys() == _SINGLE_MEMBERS
 
         with uncache_import("tests/managerdata", "single") as m:
             manager = ModuleManager(m)
             assert manager.name == "single"
             assert len(manager.modules) == 1
             single = manager.modules["single"]
-            assert single.members.keys() == {"foo", "func"}
+            assert single.members.keys() == _SINGLE_MEMBERS
 
-    def test_get_definition_dotted(self):
-        manager = ModuleManager("tests.managerdata.get_canonical_member")
+    def test_get_definition_dotted(self, canonical_manager: ModuleManager):
+        manager = canonical_manager
         moda = manager.modules["tests.managerdata.get_canonical_member.a"]
         modb = manager.modules["tests.managerdata.get_canonical_member.b"]
         moda_A_a = moda.members["A"].members["a"]
@@ -139,10 +146,8 @@ class TestModuleManager:
 
 
 class TestModule:
-    def test_get_canonical_member(self):
-        from .managerdata import get_canonical_member
-
-        manager = ModuleManager(get_canonical_member)
+    def test_get_canonical_member(self, canonical_manager: ModuleManager):
+        manager = canonical_manager
         module = manager.modules["tests.managerdata.get_canonical_member.a"]
         assert (
             module.get_canonical_member("a").fullname
@@ -175,7 +180,7 @@ class TestClass:
         from .managerdata import class_instvar_combination
 
         manager = ModuleManager(class_instvar_combination)
-        name, module = manager.modules.popitem()
+        module = next(iter(manager.modules.values()))
         assert module.members["A"].members["a"].astobj.annotation.id == "str"
         assert module.members["A"].members["a"].astobj.docstring == "a docstring"
         assert module.members["A"].members["b"].astobj.docstring == "b docstring"
@@ -227,7 +232,7 @@ class TestVariable:
         from .managerdata import variable_is_typealias
 
         manager = ModuleManager(variable_is_typealias)
-        name, module = manager.modules.popitem()
+        module = next(iter(manager.modules.values()))
         assert module.members["a"].is_typealias
         assert module.members["b"].is_typealias
         assert module.members["c"].is_typealias
@@ -8,6 +8,26 @@ from tests.utils import uncache_import
 
 _PATH = "tests/modulefinderdata"
 
+_EXPECTED_SCAN_MODULES = frozenset(
+    {
+        "simplepkg.sub",
+        "simplepkg.sub.a",
+        "simplepkg.foo",
+        "simplepkg.simplenamespace.portion1",
+        "simplepkg.simplenamespace.portion2",
+    }
+)
+_EXPECTED_SCAN_STUBS = frozenset(
+    {
+        "simplepkg.sub",
+        "simplepkg.sub.a",
+        "simplepkg.sub.stubalone",
+        "simplepkg.stubalone",
+        "simplepkg.foo",
+        "simplepkg.simplenamespace.portion1",
+    }
+)
+
 
 class TestModuleFinder:
     @pytest.fixture(autouse=True)
@@ -24,22 +44,9 @@ class TestModuleFinder:
         with uncache_import(_PATH, "simplepkg") as m:
             finder = ModuleFinder(default_config)
             modules, stubs = finder.scan_modules("simplepkg", m.__path__, ({}, {}))
-        assert modules.keys() == {
-            "simplepkg.sub",
-            "simplepkg.sub.a",
-            "simplepkg.foo",
-            "simplepkg.simplenamespace.portion1",
-            "simplepkg.simplenamespace.portion2",
-        }
+        assert modules.keys() == _EXPECTED_SCAN_MODULES
         assert hasattr(modules["simplepkg.sub"], "__path__")
-        assert stubs.keys() == {
-            "simplepkg.sub",
-            "simplepkg.sub.a",
-            "simplepkg.sub.stubalone",
-            "simplepkg.stubalone",
-            "simplepkg.foo",
-            "simplepkg.simplenamespace.portion1",
-        }
+        assert stubs.keys() == _EXPECTED_SCAN_STUBS
         assert stubs["simplepkg.sub"].is_package == True
         assert stubs["simplepkg.sub"].origin.endswith("__init__.pyi")
         assert stubs["simplepkg.foo"].origin.endswith("foo.pyi")
@@ -1,10 +1,13 @@
 import ast
 import inspect
 import os
+import sys
 import textwrap
-from functools import partial
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Callable, List, TypeVar, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 import pytest
 
@@ -12,6 +15,8 @@ from nb_autodoc.utils import (
     calculate_relpath,
     cleandoc,
     dedent,
+    find_name_in_mro,
+    fnmatch_filter,
     getmodulename,
     stringify_signature,
 )
@@ -20,52 +25,88 @@ T = TypeVar("T")
 TT = TypeVar("TT")
 
 
-def _is_str_node(node: ast.Expr) -> bool:
-    import sys
+# input of `_get_text` must be checked as string node
+if sys.version_info >= (3, 8):
 
-    node = node.value  # type: ignore
+    def _is_str_node(node: ast.Expr) -> bool:
+        value = node.value
+        return type(value) is ast.Constant and type(value.value) is str
 
-    if sys.version_info >= (3, 8):
-        return isinstance(node, ast.Constant) and isinstance(node.s, str)
-    return isinstance(node, ast.Str)
+    _get_text: Callable[[ast.Expr], str] = attrgetter("value.value")
 
+else:
 
-def _compat_get_text(node: ast.Expr) -> str:
-    # input must be checked as string node
-    return getattr(node.value, node.value._fields[0])
+    def _is_str_node(node: ast.Expr) -> bool:
+        return type(node.value) is ast.Str
+
+    _get_text = attrgetter("value.s")
+
+
+def _get_expr_docstring(stmt: Optional[ast.stmt]) -> Optional[str]:
+    if isinstance(stmt, ast.Expr) and _is_str_node(stmt):
+        return _get_text(stmt)
+    return None
+
+
+def _assign_docstrings(
+    stmt: Union[ast.Assign, ast.AnnAssign], next_stmt: Optional[ast.stmt]
+) -> List[str]:
+    docstring = _get_expr_docstring(next_stmt)
+    return [docstring] if docstring is not None else []
+
+
+def _function_docstrings(
+    stmt: Union[ast.FunctionDef, ast.AsyncFunctionDef], next_stmt: Optional[ast.stmt]
+) -> List[str]:
+    docstring = _get_expr_docstring(stmt.body[0])
+    return [docstring] if docstring is not None else []
+
+
+_def_stmt_types = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+def _class_docstrings(stmt: ast.ClassDef, next_stmt: Optional[ast.stmt]) -> List[str]:
+    # a lone statement other than docstring or nested definition holds nothing,
+    # such as `...`, `pass` or an assignment without follower
+    body = stmt.body
+    if (
+        len(body) == 1
+        and _get_expr_docstring(body[0]) is None
+        and type(body[0]) not in _def_stmt_types
+    ):
+        return []
+    return _traverse_docstring(stmt)
+
+
+# concrete AST classes are never subclassed, so dispatch on exact type
+_docstring_handlers: Dict[type, Callable[[Any, Optional[ast.stmt]], List[str]]] = {
+    ast.Assign: _assign_docstrings,
+    ast.AnnAssign: _assign_docstrings,
+    ast.FunctionDef: _function_docstrings,
+    ast.AsyncFunctionDef: _function_docstrings,
+    ast.ClassDef: _class_docstrings,
+}
 
 
 def _traverse_docstring(node: Union[ast.Module, ast.ClassDef]) -> List[str]:
     docstrings: List[str] = []
 
-    stmt = node.body[0]
-    if isinstance(stmt, ast.Expr) and _is_str_node(stmt):
-        docstrings.append(_compat_get_text(stmt))
-
-    for i, stmt in enumerate(node.body):
-        if (
-            isinstance(stmt, (ast.Assign, ast.AnnAssign))
-            and (not i == len(node.body))
-            and isinstance(node.body[i + 1], ast.Expr)
-        ):
-            expr = cast("ast.Expr", node.body[i + 1])
-            if not _is_str_node(expr):
-                continue
-            docstrings.append(_compat_get_text(expr))
-        elif isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)) and isinstance(
-            stmt.body[0], ast.Expr
-        ):
-            expr = stmt.body[0]
-            if not _is_str_node(expr):
-                continue
-            docstrings.append(_compat_get_text(expr))
-        elif isinstance(stmt, ast.ClassDef):
-            docstrings.extend(_traverse_docstring(stmt))
+    docstring = _get_expr_docstring(node.body[0])
+    if docstring is not None:
+        docstrings.append(docstring)
+
+    # pair each statement with the next one, the last one has no follower
+    body = node.body
+    for stmt, next_stmt in zip(body, [*body[1:], None]):
+        handler = _docstring_handlers.get(type(stmt))
+        if handler:
+            docstrings.extend(handler(stmt, next_stmt))
 
     return docstrings
 
 
-def traverse_docstring(module_file: Union[Path, str]) -> List[str]:
+@lru_cache(maxsize=None)
+def traverse_docstring(module_file: Union[Path, str]) -> Tuple[str, ...]:
     """Traverse docstring by analysis AST.
 
     Simply traverse the top-level variable, function, class, method docstring.
@@ -74,28 +115,29 @@ def traverse_docstring(module_file: Union[Path, str]) -> List[str]:
     even though this is not experimented.
 
     There is more trouble using import system, such as variable docstring.
+
+    The result is cached, so it is a tuple to keep the cache untouched.
     """
-    mod = ast.parse(open(module_file, "r").read())
-    docstrings = _traverse_docstring(mod)
-    return docstrings
+    # parser decodes source with its encoding declaration
+    mod = ast.parse(Path(module_file).read_bytes(), filename=str(module_file))
+    return tuple(_traverse_docstring(mod))
 
 
 @pytest.fixture(scope="module")
 def docstrings():
     file = Path(__file__).resolve().parent / "data" / "example_google_docstring.py"
-    docstrings = traverse_docstring(file)
-    return docstrings
+    return list(traverse_docstring(file))
 
 
 @pytest.fixture(scope="module")
 def indented_texts(docstrings: List[str]):
-    results = []
-    for docstring in docstrings:
-        chunk = docstring.split("\n", 1)
-        if len(chunk) == 1:
-            continue
-        results.append(chunk[1])
-    return results
+    # text after the first line, skip single line docstrings
+    return [
+        rest
+        for docstring in docstrings
+        for _, linebreak, rest in (docstring.partition("\n"),)
+        if linebreak
+    ]
 
 
 # inspect
@@ -110,6 +152,20 @@ def test_getmodulename():
     assert getmodulename(norm("/xxx-yyy.py")) == None
 
 
+def test_find_name_in_mro():
+    class A:
+        x = 1
+        y = 2
+
+    class B(A):
+        x = 3
+
+    assert find_name_in_mro(B, "x", None) == 3
+    assert find_name_in_mro(B, "y", None) == 2
+    assert find_name_in_mro(B, "z", None) is None
+    assert find_name_in_mro(B, "__init__", None) is object.__init__
+
+
 def test_stringify_signature():
     def func(a: int, b: dict = {}) -> str:
         ...
@@ -167,12 +223,20 @@ def test_stringify_signature():
 
 
 def partial_map(f: Callable[[T], TT], lst: List[T]) -> Callable[[], List[TT]]:
-    return partial(list, map(f, lst))
+    # the list is built per call, a shared iterator is exhausted after first round
+    def run() -> List[TT]:
+        return [f(x) for x in lst]
+
+    return run
 
 
 # @pytest.mark.benchmark(group="utils.dedent")
 def test_dedent(indented_texts: List[str]):
     # benchmark.pedantic(partial_map(dedent, indented_texts), iterations=10, rounds=100)
+    run = partial_map(dedent, indented_texts)
+    first = run()
+    assert first
+    assert run() == first
     for text in indented_texts:  # for string diff
         test_text = dedent(text)
         target_text = textwrap.dedent(text)
@@ -189,10 +253,7 @@ def test_dedent(indented_texts: List[str]):
 # @pytest.mark.benchmark(group="utils.cleandoc")
 def test_cleandoc(docstrings: List[str]):
     # benchmark.pedantic(partial_map(cleandoc, docstrings), iterations=10, rounds=100)
-    for docstring in docstrings:
-        test_docstring = cleandoc(docstring)
-        target_docstring = inspect.cleandoc(docstring)
-        assert test_docstring == target_docstring
+    assert list(map(cleandoc, docstrings)) == list(map(inspect.cleandoc, docstrings))
 
 
 # @pytest.mark.benchmark(group="utils.cleandoc")
@@ -208,3 +269,12 @@ def test_calculate_relpath():
         calculate_relpath(Path("/usr/var/log"), Path("/usr/var/xxx/yyy")) == "../../log"
     )
     assert calculate_relpath(Path("/usr/var/log"), Path("/usr")) == "var/log"
+
+
+def test_fnmatch_filter():
+    check = fnmatch_filter(["pkg._*", "pkg.sub?", "a.[bc]"])
+    for name in ("pkg._x", "pkg._x.y", "pkg.sub1", "a.b", "a.c", "x", "pkg.sub12"):
+        assert check(name) == any(
+            fnmatchcase(name, pt) for pt in ("pkg._*", "pkg.sub?", "a.[bc]")
+        )
+    assert not fnmatch_filter([])("pkg")
@@ -18,6 +18,7 @@ def uncache_import(path: Union[str, Tuple[str, ...]], module: str):
     finally:
         sys.path[:] = saved_path
         del sys.modules[module]
-        subnames = [i for i in sys.modules if i.startswith(module + ".")]
+        prefix = module + "."
+        subnames = [i for i in sys.modules if i.startswith(prefix)]
         for name in subnames:
             del sys.modules[name]